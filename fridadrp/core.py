@@ -0,0 +1,18 @@
+
+import astropy.units as u
+
+
+# FRIDA detector: Teledyne HAWAII-2RG, 2048 x 2048 pixels
+FRIDA_NAXIS1_HAWAII = 2048 * u.pix
+FRIDA_NAXIS2_HAWAII = 2048 * u.pix
+
+FRIDA_VALID_GRATINGS = [
+    'low-zJ',
+    'low-JH',
+    'medium-z',
+    'medium-J',
+    'medium-H',
+    'medium-K',
+    'high-H',
+    'high-K',
+]
@@ -0,0 +1,215 @@
+
+import inspect
+
+import astropy.units as u
+
+try:
+    from astropy.utils.compat import COPY_IF_NEEDED
+except ImportError:
+    COPY_IF_NEEDED = False
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+from fridadrp.core import FRIDA_NAXIS1_HAWAII
+from fridadrp.core import FRIDA_VALID_GRATINGS
+
+
+# unit singletons interned at import time; comparing against these
+# with 'is' is a single pointer check (astropy caches named units, so
+# identity holds for units built the usual way), with '==' kept as
+# fallback for equivalent units constructed differently
+_U_PIX = u.pix
+_U_UM = u.micrometer
+_U_UM_PER_PIX = u.micrometer / u.pix
+_U_DL = u.dimensionless_unscaled
+
+
+# nominal (CRVAL1, CDELT1) for each grating, in micrometer
+# and micrometer / pix, assuming CRPIX1 = 1 pix
+NOMINAL_GRATING_WAVECAL = {
+    'low-zJ': (0.89, 3.86e-4),
+    'low-JH': (1.10, 4.91e-4),
+    'medium-z': (0.83, 9.12e-5),
+    'medium-J': (1.08, 1.19e-4),
+    'medium-H': (1.43, 1.56e-4),
+    'medium-K': (1.93, 2.08e-4),
+    'high-H': (1.57, 3.62e-5),
+    'high-K': (2.09, 4.83e-5),
+}
+
+
+@njit(cache=True, fastmath=True)
+def _wave_kernel(pix_val, crpix1, crval1, cdelt1):
+    return crval1 + (pix_val - crpix1) * cdelt1
+
+
+@njit(cache=True, fastmath=True)
+def _pixel_kernel(wave_val, crpix1, crval1, inv_cdelt1):
+    # one output allocation, then in-place updates; a multiply by the
+    # precomputed reciprocal replaces the division
+    out = wave_val - crval1
+    out *= inv_cdelt1
+    out += crpix1
+    return out
+
+
+def check_units(**expected_units):
+    """Decorator to check the units of the arguments of a function.
+
+    The argument names are resolved once at decoration time, so that
+    the wrapper only has to walk the actual call arguments instead of
+    binding the signature on every call.
+    """
+    def decorator(func):
+        names = tuple(inspect.signature(func).parameters)
+        # expected units aligned with the positional arguments (None
+        # for unchecked parameters), so the wrapper is a single zip
+        expected_tuple = tuple(expected_units.get(name) for name in names)
+        keyword = tuple(expected_units.items())
+
+        def wrapper(*args, **kwargs):
+            for name, value, expected_unit in zip(names, args, expected_tuple):
+                if expected_unit is not None \
+                        and isinstance(value, u.Quantity) \
+                        and value.unit is not expected_unit \
+                        and value.unit != expected_unit:
+                    raise ValueError('Unexpected units for {}: {}'.format(
+                        name, value.unit))
+            if kwargs:
+                for name, expected_unit in keyword:
+                    if name in kwargs:
+                        value = kwargs[name]
+                        if isinstance(value, u.Quantity) \
+                                and value.unit is not expected_unit \
+                                and value.unit != expected_unit:
+                            raise ValueError(
+                                'Unexpected units for {}: {}'.format(
+                                    name, value.unit))
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class LinearWaveCal:
+    """Linear wavelength calibration of a detector axis.
+
+    The calibration is stored both as the original Quantity objects
+    and as plain floats in fixed units (pix, micrometer and
+    micrometer / pix), so that the per-pixel methods can work on raw
+    numpy values and avoid Quantity arithmetic in the hot path.
+    """
+
+    __slots__ = ('crpix1_wavecal', 'crval1_wavecal', 'cdelt1_wavecal',
+                 'naxis1_wavecal', 'grating',
+                 '_crpix1_pix', '_crval1_um', '_cdelt1', '_naxis1',
+                 '_inv_cdelt1')
+
+    @check_units(crpix1_wavecal=_U_PIX,
+                 crval1_wavecal=_U_UM,
+                 cdelt1_wavecal=_U_UM_PER_PIX,
+                 naxis1_wavecal=_U_PIX)
+    def __init__(self, crpix1_wavecal, crval1_wavecal, cdelt1_wavecal,
+                 naxis1_wavecal, grating=None):
+        self.crpix1_wavecal = crpix1_wavecal
+        self.crval1_wavecal = crval1_wavecal
+        self.cdelt1_wavecal = cdelt1_wavecal
+        self.naxis1_wavecal = naxis1_wavecal
+        self.grating = grating
+        # scalar values in fixed units, employed by wave_at_pixel
+        # and pixel_at_wave
+        self._crpix1_pix = crpix1_wavecal.to_value(_U_PIX)
+        self._crval1_um = crval1_wavecal.to_value(_U_UM)
+        self._cdelt1 = cdelt1_wavecal.to_value(_U_UM_PER_PIX)
+        self._naxis1 = int(naxis1_wavecal.to_value(_U_PIX))
+        self._inv_cdelt1 = 1.0 / self._cdelt1
+
+    # nominal calibrations built by define_from_grating, keyed by
+    # grating; instances are not modified after construction, so the
+    # same object can be shared between callers
+    _nominal_cache = {}
+
+    @property
+    def naxis1(self):
+        """NAXIS1 as a plain int, handy for sizing arrays."""
+        return self._naxis1
+
+    @classmethod
+    def define_from_grating(cls, grating):
+        """Return the nominal wavelength calibration for a FRIDA grating."""
+        try:
+            return cls._nominal_cache[grating]
+        except KeyError:
+            pass
+        if grating not in FRIDA_VALID_GRATINGS:
+            raise ValueError('Unexpected grating: {}'.format(grating))
+        crval1, cdelt1 = NOMINAL_GRATING_WAVECAL[grating]
+        wavecal = cls(
+            crpix1_wavecal=1 * u.pix,
+            crval1_wavecal=crval1 * u.micrometer,
+            cdelt1_wavecal=cdelt1 * u.micrometer / u.pix,
+            naxis1_wavecal=FRIDA_NAXIS1_HAWAII,
+            grating=grating,
+        )
+        cls._nominal_cache[grating] = wavecal
+        return wavecal
+
+    def __eq__(self, other):
+        if isinstance(other, LinearWaveCal):
+            return (
+                self._crpix1_pix == other._crpix1_pix
+                and self._crval1_um == other._crval1_um
+                and self._cdelt1 == other._cdelt1
+                and self._naxis1 == other._naxis1
+                and self.grating == other.grating
+            )
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self._crpix1_pix, self._crval1_um, self._cdelt1,
+                     self._naxis1, self.grating))
+
+    def __str__(self):
+        return '<LinearWaveCal instance>\n' + \
+            'crpix1_wavecal: {}\n'.format(self.crpix1_wavecal) + \
+            'crval1_wavecal: {}\n'.format(self.crval1_wavecal) + \
+            'cdelt1_wavecal: {}\n'.format(self.cdelt1_wavecal) + \
+            'naxis1_wavecal: {}'.format(self.naxis1_wavecal)
+
+    def __repr__(self):
+        return 'LinearWaveCal(crpix1_wavecal={}, crval1_wavecal={}, ' \
+            'cdelt1_wavecal={}, naxis1_wavecal={})'.format(
+                repr(self.crpix1_wavecal), repr(self.crval1_wavecal),
+                repr(self.cdelt1_wavecal), repr(self.naxis1_wavecal))
+
+    def wave_at_pixel(self, pixel):
+        """Wavelength at a given detector pixel.
+
+        The pixel can be given in 'pix' units (FITS convention, first
+        pixel is 1) or dimensionless (array index, first pixel is 0).
+        """
+        unit = pixel.unit
+        if unit is _U_PIX or unit == _U_PIX:
+            offset = 0.0
+        elif unit is _U_DL or unit == _U_DL:
+            offset = 1.0
+        else:
+            raise ValueError('Unexpected pixel units: {}'.format(unit))
+        # the array-index offset is folded into the reference pixel, so
+        # dimensionless input costs no intermediate array
+        wave_val = _wave_kernel(pixel.value, self._crpix1_pix - offset,
+                                self._crval1_um, self._cdelt1)
+        return u.Quantity(wave_val, _U_UM, copy=COPY_IF_NEEDED)
+
+    @check_units(wave=_U_UM)
+    def pixel_at_wave(self, wave):
+        """Detector pixel (FITS convention) at a given wavelength."""
+        wave_val = wave.to_value(_U_UM)
+        pix_val = _pixel_kernel(wave_val, self._crpix1_pix,
+                                self._crval1_um, self._inv_cdelt1)
+        return u.Quantity(pix_val, _U_PIX, copy=COPY_IF_NEEDED)
@@ -0,0 +1,99 @@
+import astropy.units as u
+import numpy as np
+import pytest
+
+from fridadrp.core import FRIDA_VALID_GRATINGS
+from ..linear_wavelength_calibration import LinearWaveCal
+
+
+def create_wavecal():
+    return LinearWaveCal(
+        crpix1_wavecal=1 * u.pix,
+        crval1_wavecal=1.9 * u.micrometer,
+        cdelt1_wavecal=5.0e-4 * u.micrometer / u.pix,
+        naxis1_wavecal=2048 * u.pix,
+    )
+
+
+def test_wave_at_pixel():
+    wavecal = create_wavecal()
+
+    wave = wavecal.wave_at_pixel(1 * u.pix)
+    assert wave.unit == u.micrometer
+    assert wave.value == pytest.approx(1.9)
+
+
+def test_wave_at_pixel_dimensionless():
+    wavecal = create_wavecal()
+
+    # array index 0 corresponds to FITS pixel 1
+    wave = wavecal.wave_at_pixel(0 * u.dimensionless_unscaled)
+    assert wave.value == pytest.approx(1.9)
+
+
+def test_wave_at_pixel_array():
+    wavecal = create_wavecal()
+
+    pixel = np.arange(1, 2049) * u.pix
+    wave = wavecal.wave_at_pixel(pixel)
+    assert wave.shape == (2048,)
+    assert wave[0].value == pytest.approx(1.9)
+    assert wave[-1].value == pytest.approx(1.9 + 2047 * 5.0e-4)
+
+
+def test_pixel_at_wave_roundtrip():
+    wavecal = create_wavecal()
+
+    pixel = np.linspace(1, 2048, num=17) * u.pix
+    result = wavecal.pixel_at_wave(wavecal.wave_at_pixel(pixel))
+    assert result.unit == u.pix
+    assert np.allclose(result.value, pixel.value)
+
+
+def test_invalid_units():
+    wavecal = create_wavecal()
+
+    with pytest.raises(ValueError):
+        wavecal.wave_at_pixel(1 * u.micrometer)
+
+    with pytest.raises(ValueError):
+        LinearWaveCal(
+            crpix1_wavecal=1 * u.micrometer,
+            crval1_wavecal=1.9 * u.micrometer,
+            cdelt1_wavecal=5.0e-4 * u.micrometer / u.pix,
+            naxis1_wavecal=2048 * u.pix,
+        )
+
+
+def test_naxis1():
+    wavecal = create_wavecal()
+    assert isinstance(wavecal.naxis1, int)
+    assert wavecal.naxis1 == 2048
+
+
+def test_equality():
+    assert create_wavecal() == create_wavecal()
+    assert create_wavecal() != LinearWaveCal.define_from_grating('medium-K')
+
+
+def test_hash():
+    assert hash(create_wavecal()) == hash(create_wavecal())
+    assert len({create_wavecal(), create_wavecal()}) == 1
+
+
+@pytest.mark.parametrize('grating', FRIDA_VALID_GRATINGS)
+def test_define_from_grating(grating):
+    wavecal = LinearWaveCal.define_from_grating(grating)
+    assert wavecal.grating == grating
+    assert wavecal.naxis1_wavecal == 2048 * u.pix
+
+
+def test_define_from_grating_is_cached():
+    wavecal1 = LinearWaveCal.define_from_grating('medium-K')
+    wavecal2 = LinearWaveCal.define_from_grating('medium-K')
+    assert wavecal1 is wavecal2
+
+
+def test_define_from_grating_invalid():
+    with pytest.raises(ValueError):
+        LinearWaveCal.define_from_grating('prism')
@@ -1,16 +1,20 @@
 
+import pytest
 import numina.core
 
 from ..loader import drp_load
 
 
-def test_recipes_are_defined():
+@pytest.fixture(scope="module")
+def this_drp():
+    return drp_load()
 
-    this_drp = drp_load()
+
+def test_recipes_are_defined(this_drp):
 
     assert 'default' in this_drp.pipelines
 
     for pipeval in this_drp.pipelines.values():
         for key, val in pipeval.recipes.items():
             recipe = pipeval.get_recipe_object(key)
-            assert isinstance(recipe, numina.core.BaseRecipe)
\ No newline at end of file
+            assert isinstance(recipe, numina.core.BaseRecipe)
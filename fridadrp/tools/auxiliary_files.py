@@ -0,0 +1,66 @@
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+
+import pooch
+
+
+# configuration and fetched paths, keyed by grating; warm calls skip
+# the JSON parse and the registry construction
+_AUX_CACHE = {}
+
+
+def define_auxiliary_files(grating, verbose=False):
+    """Return the auxiliary files required for a given grating.
+
+    Every file is downloaded (or verified against the local Pooch
+    cache through its md5 hash) and the local paths are returned in a
+    dictionary keyed by file label. Results are cached per grating, so
+    batch runs over many scenes only parse the configuration JSON and
+    rebuild the registry once.
+    """
+    if grating in _AUX_CACHE:
+        return _AUX_CACHE[grating]
+
+    fconf = os.path.join(os.path.dirname(__file__),
+                         'configuration_FRIDA_IFU_simulator.json')
+    with open(fconf, mode='rt') as f:
+        dconf = json.load(f)
+
+    if grating not in dconf['gratings']:
+        raise ValueError('Unexpected grating: {}'.format(grating))
+
+    # registry with the md5 hash of every required file
+    registry_md5 = {}
+    labels = {}
+    for label, item in dconf['global'].items():
+        registry_md5[item['filename']] = 'md5:{}'.format(item['md5'])
+        labels[item['filename']] = label
+    for label, item in dconf['gratings'][grating].items():
+        registry_md5[item['filename']] = 'md5:{}'.format(item['md5'])
+        labels[item['filename']] = label
+
+    pooch_inst = pooch.create(
+        path=pooch.os_cache('fridadrp'),
+        base_url=dconf['base_url'],
+        registry=registry_md5,
+    )
+
+    # each fetch is I/O bound (HTTP request plus md5 verification), so
+    # the files are verified/downloaded concurrently; the progress bar
+    # does not mix well with threads and is left disabled
+    def fetch(filename):
+        return filename, pooch_inst.fetch(filename, progressbar=False)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(fetch, registry_md5))
+
+    faux_dict = {}
+    for filename, path in results:
+        faux_dict[labels[filename]] = path
+        if verbose:
+            print('Required file: {} -> {}'.format(filename, path))
+
+    _AUX_CACHE[grating] = faux_dict
+    return faux_dict
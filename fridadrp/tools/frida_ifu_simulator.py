@@ -0,0 +1,39 @@
+"""Command line interface for the FRIDA IFU simulator.
+
+Only argparse is imported at module level: astropy, numpy, pooch and
+the processing modules are pulled in after the arguments have been
+parsed, so that --help and argument errors return immediately instead
+of paying the full import cost first.
+"""
+
+import argparse
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description='FRIDA IFU simulator',
+    )
+    # the grating is validated later by define_auxiliary_files, to
+    # avoid importing the instrument definitions just to build the
+    # 'choices' list
+    parser.add_argument('--grating', type=str, default='medium-K',
+                        help='grating name')
+    parser.add_argument('--verbose', action='store_true',
+                        help='display additional information')
+    args = parser.parse_args(args=args)
+
+    # deferred imports (see module docstring)
+    from fridadrp.processing.linear_wavelength_calibration import \
+        LinearWaveCal
+    from fridadrp.tools.auxiliary_files import define_auxiliary_files
+
+    faux_dict = define_auxiliary_files(args.grating, verbose=args.verbose)
+    wavecal = LinearWaveCal.define_from_grating(args.grating)
+    if args.verbose:
+        for label, path in faux_dict.items():
+            print('{}: {}'.format(label, path))
+        print(wavecal)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,8 @@
+import pytest
+
+from ..auxiliary_files import define_auxiliary_files
+
+
+def test_invalid_grating():
+    with pytest.raises(ValueError):
+        define_auxiliary_files('prism')
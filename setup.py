@@ -16,16 +16,23 @@ setup(
         'fridadrp': [
             'drp.yaml',
         ],
-        'fridadrp.instrument.configs': ['*.json']
+        'fridadrp.instrument.configs': ['*.json'],
+        'fridadrp.tools': ['*.json'],
     },
     install_requires=[
         'setuptools',
         'numina >= 0.16',
+        'numpy',
+        'astropy',
+        'pooch',
     ],
     entry_points={
         'numina.pipeline.1': [
             'FRIDA = fridadrp.loader:drp_load',
-        ]
+        ],
+        'console_scripts': [
+            'fridadrp-ifu_simulator = fridadrp.tools.frida_ifu_simulator:main',
+        ],
     },
     classifiers=[
         "Programming Language :: Python :: 2.7",